@@ -1,23 +1,38 @@
 """CloudHawk Lawn Mower integration for Home Assistant."""
 import asyncio
 import logging
-from datetime import timedelta
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.debounce import Debouncer
+# Imported from helpers.entity (not device_registry) to keep the 2023.8
+# floor declared in hacs.json importable
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .cloudhawk_mower import CloudHawkMower
+from .cloudhawk_mower import CloudHawkMower, MowerState
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BUTTON, Platform.SWITCH, Platform.LAWN_MOWER]
+# Precomputed display labels so the push path doesn't re-run
+# replace/title on every BLE frame
+_STATUS_LABELS = {state: state.value.replace("_", " ").title() for state in MowerState}
 
-# No regular polling - updates triggered by mower data callbacks
-UPDATE_INTERVAL = timedelta(hours=1)  # Very long interval as fallback
+PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.BUTTON, Platform.LAWN_MOWER]
+
+# Short cooldown to coalesce bursts of BLE notifications into one update
+PUSH_DEBOUNCE_COOLDOWN = 0.1
+
+# How long to wait for the initial connection before letting HA retry setup
+CONNECT_TIMEOUT = 15
+
+# How long stale data remains acceptable before a failed refresh marks
+# entities unavailable (seconds)
+LAST_DATA_TTL = 60
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -35,18 +50,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         name=name,
     )
     
-    # Set up callback to be notified when mower sends new data
+    # Set up callbacks to be notified of new data and connection changes
     mower.set_data_update_callback(coordinator._on_mower_data_update)
+    mower.set_connection_status_callback(coordinator._on_connection_status_change)
     
+    # Connect once; on failure let HA core schedule the setup retry with
+    # its own capped backoff instead of running our own retry loop
+    try:
+        connected = await asyncio.wait_for(mower.connect(address), timeout=CONNECT_TIMEOUT)
+    except asyncio.TimeoutError as ex:
+        # connect() may have been cancelled mid-flight with the BLE link
+        # up and background tasks running; tear down so the abandoned
+        # instance doesn't hold the mower's only connection slot
+        await mower.disconnect()
+        raise ConfigEntryNotReady(f"Timed out connecting to mower at {address}") from ex
+    if not connected:
+        await mower.disconnect()
+        raise ConfigEntryNotReady(f"Could not connect to mower at {address}")
+
     # Store coordinator in hass data
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
-    
-    # Set up platforms first
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    
-    # Start connection establishment as first task after setup
-    asyncio.create_task(coordinator._establish_connection())
-    
+
     return True
 
 
@@ -54,6 +80,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        # Unregister callbacks so the mower library doesn't keep the
+        # coordinator alive (or call into it) after unload
+        coordinator.mower.set_data_update_callback(None)
+        coordinator.mower.set_connection_status_callback(None)
         await coordinator.mower.disconnect()
     
     return unload_ok
@@ -61,115 +91,197 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 class CloudHawkDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the CloudHawk mower."""
-    
+
+    # Command name -> CloudHawkMower coroutine function
+    _COMMAND_MAP = {
+        "start": CloudHawkMower.start_mowing,
+        "spiral": CloudHawkMower.start_spiral_cutting,
+        "edge": CloudHawkMower.start_edge_cutting,
+        "stop": CloudHawkMower.stop_mowing,
+        "dock": CloudHawkMower.return_to_dock,
+    }
+
     def __init__(self, hass: HomeAssistant, mower: CloudHawkMower, address: str, name: str):
         """Initialize."""
         self.mower = mower
         self.address = address
         self.device_name = name  # Use device_name for entities
+        # unique_id prefix shared by every entity; computed once instead
+        # of three string replaces per entity at setup
+        self.device_slug = name.lower().replace(" ", "_").replace("-", "_")
+        # One DeviceInfo shared by every entity; sw_version is filled in
+        # after the first successful data build
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, address)},
+            name=name,
+            manufacturer="CloudHawk",
+            model="Lawn Mower",
+        )
         self._last_successful_data = None
+        self._last_successful_at = 0.0
+        self._cached_info = None
+        self._dirty = True
+        self._pending_command: str | None = None
+        self._command_lock = asyncio.Lock()
         self.hass = hass
-        
+        self._loop = hass.loop
+        self._push_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=PUSH_DEBOUNCE_COOLDOWN,
+            immediate=True,
+            function=self._push_refresh,
+        )
+
         super().__init__(
             hass,
             _LOGGER,
             name=f"{name} Coordinator",  # Internal coordinator name
-            update_interval=UPDATE_INTERVAL,
+            update_interval=None,  # Push-only; no polling timer
         )
 
-    @property
-    def _attr_entity_registry_enabled_default(self) -> bool:
-        """Disable coordinator entity by default."""
-        return False
-    
+    def _schedule_refresh(self):
+        """Schedule a debounced push refresh on the event loop (thread-safe)"""
+        self._loop.call_soon_threadsafe(self._async_schedule_refresh)
+
+    def _async_schedule_refresh(self):
+        """Kick off the debounced refresh (runs on the event loop).
+
+        Debouncer.async_schedule_call only exists from HA 2024.3, so
+        wrap async_call in a task to honor the 2023.8 floor.
+        """
+        self.hass.async_create_task(self._push_debouncer.async_call())
+
     def _on_mower_data_update(self):
         """Callback triggered when mower sends new data"""
-        _LOGGER.debug("New mower data received, scheduling HA update")
-        
-        # Schedule an async update in the event loop
-        def schedule_update():
-            asyncio.create_task(self.async_request_refresh())
-        
-        # Run in the event loop if we're in one, otherwise schedule it
-        try:
-            loop = asyncio.get_running_loop()
-            loop.call_soon_threadsafe(schedule_update)
-        except RuntimeError:
-            # No event loop running, schedule it for later
-            asyncio.create_task(self.async_request_refresh())
-    
+        _LOGGER.debug("New mower data received, scheduling debounced update")
+        self._dirty = True
+        self._schedule_refresh()
+
+    def _on_connection_status_change(self):
+        """Callback triggered when the mower connection state changes"""
+        _LOGGER.debug("Mower connection status changed, notifying listeners")
+
+        # A connect/disconnect event carries no new sensor data, so just
+        # re-render availability instead of scheduling a refresh that
+        # would round-trip against a possibly unreachable mower
+        self._loop.call_soon_threadsafe(self.async_update_listeners)
+
+    async def _push_refresh(self):
+        """Apply the latest pushed mower data after the debounce window"""
+        # The mower already pushed fresh data into the response store, so
+        # build the data dict directly instead of re-entering a refresh cycle
+        info = self.mower.get_cached_info()
+        self._cached_info = info
+        self._dirty = False
+        data = self._build_data(info)
+
+        # BLE devices often repeat the same frame; don't fan out to
+        # entities when nothing actually changed
+        if data == self._last_successful_data:
+            _LOGGER.debug("Mower data unchanged, skipping update")
+            return
+
+        self._last_successful_data = data
+        self._last_successful_at = time.monotonic()
+        self.device_info["sw_version"] = data["firmware_version"]
+        self.async_set_updated_data(data)
+
+    def _build_data(self, mower_info) -> dict:
+        """Build the coordinator data dict from mower info"""
+        fault_records = mower_info.fault_records
+        return {
+            "serial_number": mower_info.serial_number,
+            "firmware_version": mower_info.firmware_version,
+            "battery_level": mower_info.battery_level,
+            "is_charging": mower_info.is_charging,
+            "signal_type": mower_info.signal_type.name,
+            "trimming_enabled": mower_info.trimming_enabled,
+            "has_schedule": mower_info.has_schedule,
+            "status": _STATUS_LABELS.get(mower_info.status, "Unknown"),
+            "fault_records": fault_records,
+            # Precomputed here so entities read these per refresh instead
+            # of re-scanning/formatting the record list per state read
+            "fault_count": len(fault_records),
+            "recent_faults": [
+                f"{record.timestamp}: Error {record.error_code}"
+                for record in fault_records[-3:]
+            ],
+        }
 
     async def _async_update_data(self):
         """Update data from library store.
-        
-        This method gets data from the library's response store.
+
+        This method is only used for manually requested refreshes;
+        push updates go through _on_mower_data_update.
         """
-        try:      
+        try:
+            # Reuse the info snapshot from the last push if nothing new
+            # has arrived since
+            if self._cached_info is not None and not self._dirty:
+                return self._build_data(self._cached_info)
+
             # Get mower information from the library's response store
             mower_info = await self.mower.get_mower_info()
-            
-            # Build the data response
-            data = {
-                "serial_number": mower_info.serial_number,
-                "firmware_version": mower_info.firmware_version,
-                "battery_level": mower_info.battery_level,
-                "is_charging": mower_info.is_charging,
-                "signal_type": mower_info.signal_type.name,
-                "trimming_enabled": mower_info.trimming_enabled,
-                "has_schedule": mower_info.has_schedule,
-                "status": mower_info.status.value.replace('_', ' ').title() if mower_info.status else "Unknown",
-                "fault_records": mower_info.fault_records,
-            }
-            
+            self._cached_info = mower_info
+            self._dirty = False
+            data = self._build_data(mower_info)
+
             # Store successful data for reference
             self._last_successful_data = data
+            self._last_successful_at = time.monotonic()
+            self.device_info["sw_version"] = data["firmware_version"]
             _LOGGER.debug("Successfully updated mower data from store")
             return data
-            
+
         except Exception as ex:
+            # Fall back to recent data rather than flapping every entity
+            # to unavailable over a transient BLE hiccup
+            if (
+                self._last_successful_data is not None
+                and time.monotonic() - self._last_successful_at < LAST_DATA_TTL
+            ):
+                _LOGGER.warning(f"Error getting mower data, using last known data: {ex}")
+                return self._last_successful_data
+
             _LOGGER.error(f"Error getting mower data: {ex}")
             raise UpdateFailed(f"Error getting mower data: {ex}") from ex
     
-    async def _establish_connection(self):
-        """Establish connection to mower, retrying until successful"""
-        _LOGGER.info("Establishing connection to mower")
-        
-        while True:
-            try:
-                if await self.mower.connect(self.address):
-                    _LOGGER.info("Connection established successfully")
-                    return
-                else:
-                    _LOGGER.warning("Connection failed, retrying in 5 seconds")
-                    await asyncio.sleep(5)
-            except Exception as ex:
-                _LOGGER.error(f"Error during connection attempt: {ex}, retrying in 5 seconds")
-                await asyncio.sleep(5)
-    
     async def send_command(self, command_name: str) -> bool:
-        """Send a command to the mower via the library."""
+        """Send a command to the mower via the library.
+
+        Rapid calls coalesce last-write-wins: while one command holds the
+        BLE connection, the newest queued request supersedes any older
+        one instead of every tap serializing its own round trip.
+        """
+        if command_name not in self._COMMAND_MAP:
+            _LOGGER.error(f"Unknown command: {command_name}")
+            return False
+
+        self._pending_command = command_name
+
+        async with self._command_lock:
+            command_name = self._pending_command
+            if command_name is None:
+                # A racing call already delivered the newest command
+                return True
+            self._pending_command = None
+
+            return await self._async_send_now(command_name)
+
+    async def _async_send_now(self, command_name: str) -> bool:
+        """Dispatch a single command over BLE and log the outcome."""
         try:
             _LOGGER.debug(f"Sending command: {command_name}")
-            
-            if command_name == "start":
-                result = await self.mower.start_mowing()
-            elif command_name == "spiral":
-                result = await self.mower.start_spiral_cutting()
-            elif command_name == "edge":
-                result = await self.mower.start_edge_cutting()
-            elif command_name == "stop":
-                result = await self.mower.stop_mowing()
-            elif command_name == "dock":
-                result = await self.mower.return_to_dock()
-            else:
-                _LOGGER.error(f"Unknown command: {command_name}")
-                return False
-            
+
+            method = self._COMMAND_MAP[command_name]
+            result = await method(self.mower)
+
             if result:
                 _LOGGER.debug(f"Command '{command_name}' successful")
             else:
                 _LOGGER.warning(f"Command '{command_name}' failed")
-            
+
             return result
             
         except Exception as ex:
@@ -0,0 +1,77 @@
+"""CloudHawk Lawn Mower binary sensor platform."""
+from __future__ import annotations
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import CloudHawkDataUpdateCoordinator
+from .const import DOMAIN
+
+BINARY_SENSOR_DESCRIPTIONS: tuple[BinarySensorEntityDescription, ...] = (
+    BinarySensorEntityDescription(
+        key="trimming_enabled",
+        name="Boundary Trimming",
+        icon="mdi:scissors-cutting",
+    ),
+    BinarySensorEntityDescription(
+        key="ultrasonic_enabled",
+        name="Ultrasonic Obstacle Detection",
+        icon="mdi:radar",
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up CloudHawk binary sensor platform."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    # Feed entities straight through without building an interim list
+    async_add_entities(
+        CloudHawkBinarySensorEntity(coordinator, description)
+        for description in BINARY_SENSOR_DESCRIPTIONS
+    )
+
+
+class CloudHawkBinarySensorEntity(CoordinatorEntity, BinarySensorEntity):
+    """CloudHawk binary sensor entity."""
+
+    # The HA base classes still carry __dict__, but slotting the hot
+    # per-instance attributes keeps their reads off the dict probe
+    __slots__ = ("_key",)
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: CloudHawkDataUpdateCoordinator,
+        description: BinarySensorEntityDescription,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        # Bound locally so is_on skips the entity_description hop
+        self._key = description.key
+        # With has_entity_name, HA joins the device name in once at
+        # registration instead of us formatting it per entity
+        self._attr_name = description.name
+        # Use device name for unique_id to get better entity names
+        self._attr_unique_id = f"{coordinator.device_slug}_{description.key}"
+        # Shared DeviceInfo built once on the coordinator, which also
+        # keeps sw_version current as updates arrive
+        self._attr_device_info = coordinator.device_info
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return true if the tracked feature is enabled."""
+        data = self.coordinator.data
+        return data.get(self._key, False) if data else None
@@ -46,47 +46,46 @@ async def async_setup_entry(
 ) -> None:
     """Set up CloudHawk button platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    
+
+    # The unique_id prefix is computed once on the coordinator
+    device_id = coordinator.device_slug
     entities = [
-        CloudHawkButtonEntity(coordinator, description)
+        CloudHawkButtonEntity(coordinator, description, f"{device_id}_{description.key}")
         for description in BUTTON_DESCRIPTIONS
     ]
-    
+
     async_add_entities(entities)
 
 
 class CloudHawkButtonEntity(CoordinatorEntity, ButtonEntity):
     """CloudHawk button entity."""
-    
+
+    # No hot per-instance attributes beyond the _attr_* ones the HA base
+    # classes manage; empty slots keeps the subclass from adding more
+    __slots__ = ()
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
     def __init__(
         self,
         coordinator: CloudHawkDataUpdateCoordinator,
         description: ButtonEntityDescription,
+        unique_id: str,
     ) -> None:
         """Initialize the button."""
         super().__init__(coordinator)
         self.entity_description = description
-        # Use device name for unique_id to get better entity names
-        device_id = coordinator.device_name.lower().replace(" ", "_").replace("-", "_")
-        self._attr_unique_id = f"{device_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": coordinator.device_name,
-            "manufacturer": "CloudHawk",
-            "model": "Lawn Mower",
-            "sw_version": coordinator.data.get("firmware_version") if coordinator.data else None,
-        }
-    
-    @property
-    def name(self) -> str:
-        """Return the name of the button."""
-        return f"{self.coordinator.device_name} {self.entity_description.name}"
-    
+        self._attr_unique_id = unique_id
+        # Shared DeviceInfo built once on the coordinator, which also
+        # keeps sw_version current as updates arrive
+        self._attr_device_info = coordinator.device_info
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
-    
+        return super().available and self.coordinator.mower.is_connected()
+
     async def async_press(self) -> None:
         """Press the button."""
         await self.coordinator.send_command(self.entity_description.key)
@@ -30,15 +30,58 @@ Simplified Command-Response Model:
 import asyncio
 import logging
 import struct
-from typing import Optional, Callable, Dict, Any, List
+from time import monotonic
+from typing import Optional, Callable, Dict, List
 from datetime import datetime, date, time
 from dataclasses import dataclass, field
 from enum import Enum
 from bleak import BleakClient, BleakScanner
-from bleak.backends.characteristic import BleakGATTCharacteristic
+
+# numpy is optional - fault record parsing falls back to struct when absent
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# numba is optional too - with it, the command checksum reduces over a
+# uint8 array in JIT-compiled code, which pays off for long payloads
+# (e.g. future record downloads); without it the builtin sum is used
+try:
+    import numba
+
+    @numba.njit(cache=True, boundscheck=False)
+    def _checksum_impl(ba):  # pragma: no cover - requires numba
+        s = numba.uint32(0)
+        for b in ba:
+            s += b
+        return s & 0xFF
+
+    def _checksum(buf) -> int:
+        """Mod-256 checksum over a byte buffer"""
+        return int(_checksum_impl(np.frombuffer(bytes(buf), dtype=np.uint8)))
+except ImportError:
+    def _checksum(buf) -> int:
+        """Mod-256 checksum over a byte buffer"""
+        return sum(buf) & 0xFF
 
 logger = logging.getLogger(__name__)
 
+# Precompiled protocol structs - one C-level unpack per field group instead
+# of per-byte indexing / int.from_bytes on every packet
+_HEADER_MAGIC = b"\x55\xaa"
+_CMD_STATUS = struct.Struct(">BB")         # command byte + status byte
+_DATE_FIELDS = struct.Struct(">2xHBB")     # skip cmd/status, year, month, day
+_BATTERY_FIELDS = struct.Struct(">5xBxB")  # battery level, charging flag
+_SIGNAL_FIELDS = struct.Struct(">2xB")     # signal selection byte
+_FAULT_RECORD = struct.Struct(">HBBBBB")   # year, month, day, hour, minute, error
+
+# Structured dtype mirroring _FAULT_RECORD for one-call buffer parsing
+_FAULT_DTYPE = (
+    np.dtype([("y", ">u2"), ("mo", "u1"), ("d", "u1"), ("h", "u1"), ("mi", "u1"), ("e", "u1")])
+    if np is not None
+    else None
+)
+
 class MowerState(Enum):
     """Simple mower operational states"""
     UNKNOWN = "unknown"
@@ -50,6 +93,15 @@ class MowerState(Enum):
     ERROR = "error"
 
 
+# Status byte (8081 payload) -> mower state
+_STATUS_MAP = {
+    0x01: MowerState.RETURNING,
+    0x38: MowerState.MOWING,
+    0x0b: MowerState.DOCKED,
+    0x0e: MowerState.STOPPED,
+}
+
+
 class SignalType(Enum):
     """Boundary signal selection"""
     S1 = 1
@@ -64,6 +116,17 @@ class FaultRecord:
     error_code: int
     description: str = ""
 
+@dataclass(slots=True)
+class ResponseEntry:
+    """Parsed notification stored in the response store"""
+    # Monotonic receive time; cheaper than datetime.now() per packet and
+    # immune to wall-clock jumps when judging freshness
+    timestamp: float
+    payload: bytes | memoryview
+    data: bytes | memoryview
+    raw: bytes
+    hex: str
+
 @dataclass
 class MowerInfo:
     """Complete mower information"""
@@ -93,8 +156,8 @@ class CloudHawkMower:
     SUMIC_NOTIFY_UUID = "0000abf3-0000-1000-8000-00805f9b34fb"
     
     # Protocol constants - Updated based on HCI analysis
-    HEAD_BYTES = "55AA"
-    BLE_C1 = "80"  # BLE command prefix
+    HEAD_BYTES = b"\x55\xaa"
+    BLE_C1 = 0x80  # BLE command prefix
     
     
     # Command definitions (from decompiled LawnMowerCommand.kt)
@@ -146,75 +209,104 @@ class CloudHawkMower:
         GET_FAULT_RECORD = "15"        # Get fault record
         GET_CUTTING_RECORD = "16"      # Get cutting record
         GET_CHARGING_RECORD = "17"     # Get charging record
-        
-    
+
+    # Reverse lookup built once: command code -> command name (for logging)
+    _CODE_TO_NAME = {
+        code.lower(): name
+        for name, code in vars(Commands).items()
+        if not name.startswith("_")
+    }
+
+
     def __init__(self, device_name: str = "SN0190104721", timeout: float = 10.0):
         self.device_name = device_name
         self.timeout = timeout
         self.client: Optional[BleakClient] = None
-        self.response_data: Dict[str, Any] = {}
         self.write_char = None
         self.notify_char = None
+        self._write_handle: Optional[int] = None
         self.mower_info = MowerInfo()
         
         # Central response store for all mower data
-        self.response_store: Dict[str, Any] = {}
+        self.response_store: Dict[tuple, ResponseEntry] = {}
         self._listener_active = False
+
+        # Notification dispatch - the BLE callback only enqueues; a
+        # background task delivers to the data update callback
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._notify_queue: Optional[asyncio.Queue] = None
+        self._dispatch_task: Optional[asyncio.Task] = None
         
         # Callback for notifying when new data arrives
         self.data_update_callback: Optional[Callable] = None
-        
+
+        # Callback for notifying when the connection state changes
+        self.connection_status_callback: Optional[Callable] = None
+
         # Connection maintenance
         self._connection_maintenance_task: Optional[asyncio.Task] = None
         self._maintenance_active = False
+        self._reconnect_event = asyncio.Event()
 
         # FIX: Store the last known address so reconnection doesn't need to scan
         self._last_address: Optional[str] = None
     
-    def set_data_update_callback(self, callback: Callable):
+    def set_data_update_callback(self, callback: Optional[Callable]):
         """Set callback to be called when new data arrives from mower"""
         self.data_update_callback = callback
-    
+
+    def set_connection_status_callback(self, callback: Optional[Callable]):
+        """Set callback to be called when the connection state changes"""
+        self.connection_status_callback = callback
+
+    def _notify_connection_status(self):
+        """Notify the registered callback of a connection state change"""
+        if self.connection_status_callback:
+            try:
+                self.connection_status_callback()
+            except Exception as e:
+                logger.error(f"Error in connection status callback: {e}")
+
     def _get_command_name(self, command_code: str) -> str:
         """Get command name from command code for logging"""
-        # Find the attribute name that matches the command code
-        for attr_name in dir(self.Commands):
-            if not attr_name.startswith('_') and getattr(self.Commands, attr_name) == command_code:
-                return attr_name
-        return f"UNKNOWN({command_code})"
+        return self._CODE_TO_NAME.get(command_code.lower(), f"UNKNOWN({command_code})")
     
+    # Cache of encoded commands - the command set is a fixed table of
+    # constants, so each (code, content) pair only needs encoding once
+    _COMMAND_CACHE: Dict[tuple, bytes] = {}
+
     def generate_command(self, command_code: str, content: str = "") -> bytes:
         """Generate a properly formatted CloudHawk command
-        
+
         Based on decompiled CloudHawk code analysis (LawnMowerCommand.generateCommand):
         - Format: 55AA + [length] + [command] + [data] + [checksum]
         - Length: Number of bytes in command + data (not including header and checksum)
         - Checksum: Sum of all bytes (including header) modulo 256
         """
+        key = (command_code, content)
+        cached = self._COMMAND_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         # Build command with BLE prefix if needed
-        if len(command_code) == 2:
-            full_command = self.BLE_C1 + command_code
-        else:
-            full_command = command_code
-            
-        # Calculate length in bytes
-        command_bytes = len(full_command) // 2
-        content_bytes = len(content) // 2 if content else 0
-        total_length = command_bytes + content_bytes
-        
-        # Format: 55AA + length + command + content (before checksum)
-        length_hex = f"{total_length:02X}"
-        command_string = self.HEAD_BYTES + length_hex + full_command + content
-        
-        # Calculate checksum: sum of all bytes modulo 256 (as per TypeConverters.makeChecksum)
-        command_bytes_array = bytes.fromhex(command_string)
-        checksum = sum(command_bytes_array) % 256
-        checksum_hex = f"{checksum:02X}"
-        
-        # Final command with checksum
-        final_command = command_string + checksum_hex
-        
-        return bytes.fromhex(final_command)
+        command_bytes = bytes.fromhex(command_code)
+        if len(command_bytes) == 1:
+            command_bytes = bytes((self.BLE_C1,)) + command_bytes
+        content_bytes = bytes.fromhex(content) if content else b""
+
+        # Format: 55AA + length + command + content + checksum, assembled
+        # directly in binary with no hex round-trips
+        buf = bytearray(self.HEAD_BYTES)
+        buf.append(len(command_bytes) + len(content_bytes))
+        buf += command_bytes
+        buf += content_bytes
+
+        # Checksum: sum of all bytes modulo 256 (as per TypeConverters.makeChecksum)
+        buf.append(_checksum(buf))
+
+        encoded = bytes(buf)
+        self._COMMAND_CACHE[key] = encoded
+        return encoded
     
     async def scan_for_mower(self, scan_time: float = 10.0) -> Optional[str]:
         """Scan for CloudHawk mower and return its address"""
@@ -230,10 +322,17 @@ class CloudHawkMower:
         logger.warning("No CloudHawk mower found")
         return None
     
-    async def connect(self, address: Optional[str] = None) -> bool:
-        """Connect to the mower"""
+    async def connect(self, address: Optional[str] = None, ble_device=None) -> bool:
+        """Connect to the mower.
+
+        When a BLEDevice (e.g. from Home Assistant's central scanner) is
+        supplied, Bleak uses it directly instead of re-scanning to
+        resolve the address.
+        """
+        if ble_device is not None:
+            address = ble_device.address
         # FIX: Use last known address if none provided, before falling back to scan
-        if not address:
+        elif not address:
             if self._last_address:
                 logger.info(f"No address provided, using last known address: {self._last_address}")
                 address = self._last_address
@@ -241,10 +340,14 @@ class CloudHawkMower:
                 address = await self.scan_for_mower()
                 if not address:
                     return False
-        
+
         try:
             logger.info(f"Connecting to mower at {address}...")
-            self.client = BleakClient(address, timeout=self.timeout)
+            self.client = BleakClient(
+                ble_device if ble_device is not None else address,
+                timeout=self.timeout,
+                disconnected_callback=self._on_disconnect,
+            )
             await self.client.connect()
             
             # FIX: Store address after successful connection
@@ -269,7 +372,11 @@ class CloudHawkMower:
                 logger.error("Could not find required characteristics")
                 await self.disconnect()
                 return False
-            
+
+            # Cache the raw handle so each write skips Bleak's
+            # characteristic-object resolution
+            self._write_handle = self.write_char.handle
+
             logger.info("Successfully connected to mower")
             
             # Start background connection maintenance
@@ -278,28 +385,48 @@ class CloudHawkMower:
             # Start constant listener and populate initial data
             await self.start_constant_listener()
             await self.populate_initial_data()
-                   
+
+            self._notify_connection_status()
             return True
             
         except Exception as e:
             logger.error(f"Connection failed: {e}")
             return False
     
+    def _on_disconnect(self, client: BleakClient):
+        """Bleak disconnected_callback - wake the maintenance task"""
+        logger.debug("Disconnect callback fired")
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._reconnect_event.set)
+        else:
+            self._reconnect_event.set()
+
     async def disconnect(self):
         """Disconnect from the mower"""
+        # Stop connection maintenance first so the intentional disconnect
+        # below doesn't trigger a reconnect attempt
+        self._stop_connection_maintenance()
+
+        # Tear down the dispatch task and queue regardless of link state;
+        # after a link drop is_connected() is False but the task would
+        # otherwise sit on the queue forever and pin this instance
+        try:
+            await self.stop_constant_listener()
+        except Exception as e:
+            logger.error(f"Listener stop error: {e}")
+        self._notify_queue = None
+
         if self.is_connected():
             try:
-                await self.stop_constant_listener()
                 await self.client.disconnect()
                 logger.info("Disconnected from mower")
             except Exception as e:
                 logger.error(f"Disconnect error: {e}")
             finally:
                 self.client = None
+                self._write_handle = None
                 self._listener_active = False
-        
-        # Stop connection maintenance
-        self._stop_connection_maintenance()
+            self._notify_connection_status()
     
     def is_connected(self) -> bool:
         """Check if currently connected to the mower"""
@@ -323,24 +450,34 @@ class CloudHawkMower:
         logger.info("Stopped connection maintenance")
     
     async def _connection_maintenance_loop(self):
-        """Background task to maintain connection to mower"""
+        """Background task to reconnect when the mower drops the link
+
+        Event-driven: sleeps until Bleak's disconnected_callback fires
+        instead of polling is_connected() every few seconds.
+        """
         while self._maintenance_active:
-            try:            
-                if self._maintenance_active and not self.is_connected():
-                    logger.warning("Connection lost, attempting to reconnect")
-                    # FIX: Pass last known address directly — avoids slow/unreliable scan
-                    if await self.connect(address=self._last_address):
-                        logger.info("Connection successful")
-                    else:
-                        logger.warning("Connection failed, will retry in 5 seconds")
-                
-                await asyncio.sleep(5)  # Check every 5 seconds
+            try:
+                await self._reconnect_event.wait()
+                self._reconnect_event.clear()
+                if not self._maintenance_active or self.is_connected():
+                    continue
+
+                logger.warning("Connection lost, attempting to reconnect")
+                self._notify_connection_status()
+                # FIX: Pass last known address directly — avoids slow/unreliable scan
+                if await self.connect(address=self._last_address):
+                    logger.info("Connection successful")
+                else:
+                    logger.warning("Connection failed, will retry in 5 seconds")
+                    await asyncio.sleep(5)
+                    self._reconnect_event.set()
             except asyncio.CancelledError:
                 logger.debug("Connection maintenance task cancelled")
                 break
             except Exception as ex:
                 logger.error(f"Error in connection maintenance, will retry in 10 seconds: {ex}")
                 await asyncio.sleep(10)  # Wait before retrying
+                self._reconnect_event.set()
     
     async def start_constant_listener(self):
         """Start the constant notification listener to capture all responses"""
@@ -355,48 +492,86 @@ class CloudHawkMower:
             
         self._listener_active = True
         logger.info("Starting constant notification listener")
-        
+
+        self.loop = asyncio.get_running_loop()
+        self._notify_queue = asyncio.Queue(maxsize=64)
+        self._dispatch_task = asyncio.create_task(self._dispatch_notifications())
+
         def notification_handler(sender, data):
-            hex_data = data.hex()
-            logger.debug(f"Notification received: {hex_data}")
-            
+            # Debug logging formats hex strings per packet; skip all of it
+            # unless DEBUG is actually enabled (the production case)
+            debug = logger.isEnabledFor(logging.DEBUG)
+            hex_data = data.hex() if debug else ""
+            if debug:
+                logger.debug(f"Notification received: {hex_data}")
+
             # Parse 55AA protocol response
-            if len(data) >= 3 and data[0] == 0x55 and data[1] == 0xAA:
+            if len(data) >= 3 and data.startswith(_HEADER_MAGIC):
                 length = data[2]
-                payload = data[3:3+length] if len(data) > 3 else b''
-                
+                # Zero-copy views into the notification buffer; consumers
+                # materialize bytes only when they actually decode
+                view = memoryview(data)
+                payload = view[3:3+length] if len(data) > 3 else b''
+
                 if len(payload) >= 2:
-                    command_response = payload[0]
-                    status = payload[1]
+                    command_response, status = _CMD_STATUS.unpack_from(payload)
                     data_part = payload[2:] if len(payload) > 2 else b''
                     
-                    # Store response by command type
-                    command_type = f"{command_response:02x}{status:02x}"
-                    self.response_store[command_type] = {
-                        'timestamp': datetime.now(),
-                        'payload': payload,
-                        'data': data_part,
-                        'raw_data': data,
-                        'hex': hex_data
-                    }
+                    # Store response keyed by (command, status) - tuple
+                    # hashing needs no string formatting per packet
+                    command_type = (command_response, status)
+                    self.response_store[command_type] = ResponseEntry(
+                        monotonic(), payload, data_part, data, hex_data
+                    )
                     
                     # Get command name for logging
-                    command_name = self._get_command_name(f"{status:02x}")
-                    logger.debug(f"Received {command_name} notification: {data_part.hex()}")
-                    
-                    # Trigger callback to notify HA of new data
+                    if debug:
+                        command_name = self._get_command_name(f"{status:02x}")
+                        logger.debug(f"Received {command_name} notification: {data_part.hex()}")
+
+                    # Hand off to the event loop so a slow consumer can't
+                    # block Bleak's notification delivery
                     if self.data_update_callback:
-                        try:
-                            self.data_update_callback()
-                        except Exception as e:
-                            logger.error(f"Error in data update callback: {e}")
+                        self.loop.call_soon_threadsafe(
+                            self._enqueue_notification, self.response_store[command_type]
+                        )
         
         # Start notifications
         await self.client.start_notify(self.notify_char, notification_handler)
         logger.info("Constant listener started")
     
+    def _enqueue_notification(self, entry: ResponseEntry):
+        """Queue a parsed notification for dispatch (runs on the event loop)"""
+        # A notification scheduled before disconnect() can land after the
+        # queue was torn down; drop it instead of raising in the loop
+        if self._notify_queue is None:
+            return
+        try:
+            self._notify_queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            # Drop the oldest entry so fresh data keeps flowing
+            logger.warning("Notification queue full, dropping oldest entry")
+            try:
+                self._notify_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            self._notify_queue.put_nowait(entry)
+
+    async def _dispatch_notifications(self):
+        """Deliver queued notifications to the data update callback"""
+        while True:
+            await self._notify_queue.get()
+            if self.data_update_callback:
+                try:
+                    self.data_update_callback()
+                except Exception as e:
+                    logger.error(f"Error in data update callback: {e}")
+
     async def stop_constant_listener(self):
         """Stop the constant notification listener"""
+        if self._dispatch_task:
+            self._dispatch_task.cancel()
+            self._dispatch_task = None
         if self._listener_active and self.client and self.notify_char:
             await self.client.stop_notify(self.notify_char)
             self._listener_active = False
@@ -404,23 +579,22 @@ class CloudHawkMower:
     
     async def send_command(self, command: bytes) -> bool:
         """Send a command to the mower without waiting for response"""
-        if not self.is_connected() or not self.write_char:
+        if not self.is_connected() or self._write_handle is None:
             logger.error("Not connected to mower")
             return False
-        
-        # Extract command code for logging
-        command_hex = command.hex()
-        command_code = command_hex[8:10]  # Get command code (e.g., 07)
-        command_name = self._get_command_name(command_code)
-        
+
         try:
-            # Send command
-            await self.client.write_gatt_char(self.write_char, command)
-            logger.debug(f"Sent {command_name} command ({command_code})")
+            # Send command via the cached handle; the mower never acks
+            # writes, so skip the write-with-response round trip
+            await self.client.write_gatt_char(self._write_handle, command, response=False)
+            if logger.isEnabledFor(logging.DEBUG):
+                command_code = command.hex()[8:10]  # Get command code (e.g., 07)
+                logger.debug(f"Sent {self._get_command_name(command_code)} command ({command_code})")
             return True
-            
+
         except Exception as e:
-            logger.error(f"Error sending {command_name} command: {e}")
+            command_code = command.hex()[8:10]
+            logger.error(f"Error sending {self._get_command_name(command_code)} command: {e}")
             return False
     
     async def populate_initial_data(self):
@@ -438,52 +612,52 @@ class CloudHawkMower:
             ("fault_records", self.Commands.GET_FAULT_RECORD),
         ]
         
-        for name, command_code in initial_commands:
-            try:
-                command = self.generate_command(command_code)
-                success = await self.send_command(command)
-                if success:
-                    logger.info(f"Sent {name} command")
-                else:
-                    logger.warning(f"Failed to send {name} command")
-                # Small delay between commands
-                await asyncio.sleep(1)
-            except Exception as e:
-                logger.error(f"Error sending {name} command: {e}")
-        
+        # Dispatch all writes at once - Bleak serializes GATT writes
+        # internally, so the old 1-second inter-command delay only
+        # postponed the first data by ~7 seconds
+        results = await asyncio.gather(
+            *(self.send_command(self.generate_command(code)) for _, code in initial_commands),
+            return_exceptions=True,
+        )
+        for (name, _), result in zip(initial_commands, results):
+            if result is True:
+                logger.info(f"Sent {name} command")
+            else:
+                logger.warning(f"Failed to send {name} command: {result}")
+
         logger.info("Initial data commands sent - responses will arrive asynchronously")
     
-    def get_battery_data(self) -> Optional[Dict[str, Any]]:
+    def get_battery_data(self) -> Optional[ResponseEntry]:
         """Get battery data from store"""
-        return self.response_store.get("8083")
+        return self.response_store.get((0x80, 0x83))
     
-    def get_serial_data(self) -> Optional[Dict[str, Any]]:
+    def get_serial_data(self) -> Optional[ResponseEntry]:
         """Get serial number data from store"""
-        return self.response_store.get("8002")
+        return self.response_store.get((0x80, 0x02))
     
-    def get_firmware_data(self) -> Optional[Dict[str, Any]]:
+    def get_firmware_data(self) -> Optional[ResponseEntry]:
         """Get firmware data from store"""
-        return self.response_store.get("8001")
+        return self.response_store.get((0x80, 0x01))
     
-    def get_signal_data(self) -> Optional[Dict[str, Any]]:
+    def get_signal_data(self) -> Optional[ResponseEntry]:
         """Get signal data from store"""
-        return self.response_store.get("800b")
+        return self.response_store.get((0x80, 0x0b))
     
-    def get_trimming_data(self) -> Optional[Dict[str, Any]]:
+    def get_trimming_data(self) -> Optional[ResponseEntry]:
         """Get trimming data from store"""
-        return self.response_store.get("8007")
+        return self.response_store.get((0x80, 0x07))
     
-    def get_schedule_data(self) -> Optional[Dict[str, Any]]:
+    def get_schedule_data(self) -> Optional[ResponseEntry]:
         """Get schedule data from store"""
-        return self.response_store.get("8070")
+        return self.response_store.get((0x80, 0x70))
     
-    def get_fault_records_data(self) -> Optional[Dict[str, Any]]:
+    def get_fault_records_data(self) -> Optional[ResponseEntry]:
         """Get fault records data from store"""
-        return self.response_store.get("8015")
+        return self.response_store.get((0x80, 0x15))
     
-    def get_status_data(self) -> Optional[Dict[str, Any]]:
+    def get_status_data(self) -> Optional[ResponseEntry]:
         """Get status data from store"""
-        return self.response_store.get("8081")
+        return self.response_store.get((0x80, 0x81))
     
     # === CONTROL METHODS ===
     
@@ -491,7 +665,8 @@ class CloudHawkMower:
         """Start regular mowing"""
         logger.info("Starting mowing...")
         command = self.generate_command(self.Commands.START)
-        logger.debug(f"Start mowing command: {command.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Start mowing command: {command.hex()}")
         
         success = await self.send_command(command)
         if success:
@@ -504,7 +679,8 @@ class CloudHawkMower:
         """Start mowing once (instant mowing)"""
         logger.info("Starting mowing once...")
         command = self.generate_command(self.Commands.START_ONCE)
-        logger.debug(f"Start mowing once command: {command.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Start mowing once command: {command.hex()}")
         
         success = await self.send_command(command)
         if success:
@@ -517,7 +693,8 @@ class CloudHawkMower:
         """Stop mowing"""
         logger.info("Stopping mowing...")
         command = self.generate_command(self.Commands.STOP)
-        logger.debug(f"Stop mowing command: {command.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Stop mowing command: {command.hex()}")
         
         success = await self.send_command(command)
         if success:
@@ -530,7 +707,8 @@ class CloudHawkMower:
         """Return to charging dock"""
         logger.info("Returning to dock...")
         command = self.generate_command(self.Commands.CHARGE)
-        logger.debug(f"Return to dock command: {command.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Return to dock command: {command.hex()}")
         
         success = await self.send_command(command)
         if success:
@@ -543,7 +721,8 @@ class CloudHawkMower:
         """Start spiral cutting pattern"""
         logger.info("Starting spiral cutting...")
         command = self.generate_command(self.Commands.SPIRAL_CUT)
-        logger.debug(f"Start spiral cutting command: {command.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Start spiral cutting command: {command.hex()}")
         
         success = await self.send_command(command)
         if success:
@@ -556,7 +735,8 @@ class CloudHawkMower:
         """Start edge cutting along boundaries"""
         logger.info("Starting edge cutting...")
         command = self.generate_command(self.Commands.EDGE_CUT_ONCE)
-        logger.debug(f"Start edge cutting command: {command.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Start edge cutting command: {command.hex()}")
         
         success = await self.send_command(command)
         if success:
@@ -569,15 +749,11 @@ class CloudHawkMower:
     
     def _parse_date(self, payload: bytes) -> Optional[date]:
         """Parse date from payload: 801907e90915 -> 2025-09-21"""
-        if len(payload) >= 6:
-            try:
-                year = int.from_bytes(payload[2:4], 'big')  # 07e9 = 2025
-                month = payload[4]  # 09
-                day = payload[5]    # 15 = 21
-                return date(year, month, day)
-            except:
-                pass
-        return None
+        try:
+            year, month, day = _DATE_FIELDS.unpack_from(payload)
+            return date(year, month, day)
+        except (struct.error, ValueError):
+            return None
     
     def _parse_time(self, payload: bytes) -> Optional[time]:
         """Parse time from payload: 801b0b33 -> 11:51"""
@@ -592,24 +768,21 @@ class CloudHawkMower:
     
     def _parse_battery(self, payload: bytes) -> tuple[int, bool]:
         """Parse battery level and charging status: 80830000cd640004 -> 100%, charging"""
-        battery_level = 0
-        is_charging = False
-        
-        if len(payload) >= 8:
-            # Battery level at position 5: cd=205, 64=100
-            battery_level = payload[5]  # 64 = 100%
-            # Charging status at end: 0004 -> 04 = charging
-            if len(payload) >= 8:
-                is_charging = payload[7] == 0x04
-                
-        return battery_level, is_charging
-    
+        try:
+            # Battery level at position 5, charging flag (04) at position 7
+            battery_level, charge_flag = _BATTERY_FIELDS.unpack_from(payload)
+            return battery_level, charge_flag == 0x04
+        except struct.error:
+            return 0, False
+
     def _parse_signal_type(self, payload: bytes) -> SignalType:
         """Parse signal selection: 800b02 -> S2"""
-        if len(payload) >= 3:
-            signal_val = payload[2]  # 02 = S2
-            if signal_val in [1, 2, 3]:
-                return SignalType(signal_val)
+        try:
+            signal_val = _SIGNAL_FIELDS.unpack_from(payload)[0]  # 02 = S2
+        except struct.error:
+            return SignalType.S1
+        if signal_val in (1, 2, 3):
+            return SignalType(signal_val)
         return SignalType.S1
     
     def _parse_trimming_enabled(self, payload: bytes) -> bool:
@@ -620,26 +793,16 @@ class CloudHawkMower:
     
     def _parse_schedule_data(self, payload: bytes) -> bool:
         """Parse schedule data: all zeros = no schedule"""
-        if len(payload) > 2:
-            # Check if all data bytes are zero
-            data_part = payload[2:]
-            return not all(b == 0 for b in data_part)
-        return False
+        # Any nonzero data byte means a schedule is set; strip runs in C
+        # rather than comparing byte by byte in Python (bytes() is a
+        # no-op for bytes input and materializes memoryview slices)
+        return bytes(payload[2:]).strip(b"\x00") != b""
     
     def _parse_status(self, payload: bytes) -> MowerState:
         """Parse mower status from 8081 payload"""
         if len(payload) >= 3:
-            status_byte = payload[2]  # Status byte is at position 2
-            if status_byte == 0x01:
-                return MowerState.RETURNING
-            elif status_byte == 0x38:
-                return MowerState.MOWING
-            elif status_byte == 0x0b:
-                return MowerState.DOCKED
-            elif status_byte == 0x0e:
-                return MowerState.STOPPED
-        
-        # Default to unknown if no status matches
+            # Status byte is at position 2; unknown bytes map to UNKNOWN
+            return _STATUS_MAP.get(payload[2], MowerState.UNKNOWN)
         return MowerState.UNKNOWN
     
     def _parse_fault_records(self, payload: bytes) -> List[FaultRecord]:
@@ -649,95 +812,95 @@ class CloudHawkMower:
             # Fault records contain timestamp and error code data
             # Format appears to be: year(2) month(1) day(1) hour(1) min(1) error(1)
             data = payload[2:]
-            i = 0
-            while i + 6 < len(data):
+            usable = len(data) - len(data) % _FAULT_RECORD.size
+            if np is not None:
+                # Parse the whole buffer in one C call
+                rows = np.frombuffer(bytes(data[:usable]), dtype=_FAULT_DTYPE)
+                fields = ((int(r["y"]), int(r["mo"]), int(r["d"]), int(r["h"]), int(r["mi"]), int(r["e"])) for r in rows)
+            else:
+                fields = _FAULT_RECORD.iter_unpack(data[:usable])
+            for year, month, day, hour, minute, error_code in fields:
                 try:
-                    year = int.from_bytes(data[i:i+2], 'big')
-                    month = data[i+2]
-                    day = data[i+3]
-                    hour = data[i+4]
-                    minute = data[i+5]
-                    error_code = data[i+6]
-                    
                     timestamp = datetime(year, month, day, hour, minute)
-                    records.append(FaultRecord(timestamp, error_code))
-                    i += 7
-                except:
-                    break
+                except ValueError:
+                    continue
+                records.append(FaultRecord(timestamp, error_code))
         return records
 
     # === HIGH-LEVEL INFORMATION METHODS ===
-    
-    async def get_mower_info(self) -> MowerInfo:
-        """Get complete mower information from the response store"""
+
+    def _apply_serial(self, info: MowerInfo, entry: ResponseEntry):
+        """Fill serial number from a GET_SERIAL response"""
+        if entry.data:
+            info.serial_number = bytes(entry.data).decode('ascii', errors='ignore').strip()
+
+    def _apply_firmware(self, info: MowerInfo, entry: ResponseEntry):
+        """Fill firmware version from a GET_FIRMWARE response"""
+        if entry.data:
+            info.firmware_version = bytes(entry.data).decode('ascii', errors='ignore').strip()
+
+    def _apply_battery(self, info: MowerInfo, entry: ResponseEntry):
+        """Fill battery level/charging from a GET_BATTERY response"""
+        if entry.payload:
+            info.battery_level, info.is_charging = self._parse_battery(entry.payload)
+
+    def _apply_signal(self, info: MowerInfo, entry: ResponseEntry):
+        """Fill signal type from a GET_SIGNAL response"""
+        if entry.payload:
+            info.signal_type = self._parse_signal_type(entry.payload)
+
+    def _apply_trimming(self, info: MowerInfo, entry: ResponseEntry):
+        """Fill trimming status from a GET_TRIMMING response"""
+        if entry.payload:
+            info.trimming_enabled = self._parse_trimming_enabled(entry.payload)
+
+    def _apply_schedule(self, info: MowerInfo, entry: ResponseEntry):
+        """Fill schedule status from a GET_CUT_SCHEDULE response"""
+        if entry.payload:
+            info.has_schedule = self._parse_schedule_data(entry.payload)
+
+    def _apply_faults(self, info: MowerInfo, entry: ResponseEntry):
+        """Fill fault records from a GET_FAULT_RECORD response"""
+        if entry.payload:
+            info.fault_records = self._parse_fault_records(entry.payload)
+
+    def _apply_status(self, info: MowerInfo, entry: ResponseEntry):
+        """Fill mower status from a GET_STATUS response"""
+        if entry.payload:
+            info.status = self._parse_status(entry.payload)
+
+    # (command, status) key -> field applier, walked once per info build
+    _FIELD_PARSERS = (
+        ((0x80, 0x02), _apply_serial),
+        ((0x80, 0x01), _apply_firmware),
+        ((0x80, 0x83), _apply_battery),
+        ((0x80, 0x0b), _apply_signal),
+        ((0x80, 0x07), _apply_trimming),
+        ((0x80, 0x70), _apply_schedule),
+        ((0x80, 0x15), _apply_faults),
+        ((0x80, 0x81), _apply_status),
+    )
+
+    def get_cached_info(self) -> MowerInfo:
+        """Collect complete mower information from the response store (synchronous)"""
         info = MowerInfo()
-        
-        # Get serial number from store
-        serial_data = self.get_serial_data()
-        if serial_data and serial_data.get('data'):
-            info.serial_number = serial_data['data'].decode('ascii', errors='ignore').strip()
-            logger.debug(f"Serial number: {info.serial_number}")
-        
-        # Get firmware from store
-        firmware_data = self.get_firmware_data()
-        if firmware_data and firmware_data.get('data'):
-            fw_bytes = firmware_data['data']
-            info.firmware_version = fw_bytes.decode('ascii', errors='ignore').strip()
-            logger.debug(f"Firmware: {info.firmware_version}")
-        
-        # Get battery info from store
-        battery_data = self.get_battery_data()
-        if battery_data and battery_data.get('payload'):
-            payload = battery_data['payload']
-            battery_level, is_charging = self._parse_battery(payload)
-            info.battery_level = battery_level
-            info.is_charging = is_charging
-            logger.debug(f"Battery: {battery_level}%, Charging: {is_charging}")
-        
-        # Get signal type from store
-        signal_data = self.get_signal_data()
-        if signal_data and signal_data.get('payload'):
-            payload = signal_data['payload']
-            signal_type = self._parse_signal_type(payload)
-            info.signal_type = signal_type
-            logger.debug(f"Signal type: {signal_type.name}")
-        
-        # Get trimming status from store
-        trimming_data = self.get_trimming_data()
-        if trimming_data and trimming_data.get('payload'):
-            payload = trimming_data['payload']
-            trimming_enabled = self._parse_trimming_enabled(payload)
-            info.trimming_enabled = trimming_enabled
-            logger.debug(f"Trimming: {'Enabled' if trimming_enabled else 'Disabled'}")
-        
-        # Get schedule status from store
-        schedule_data = self.get_schedule_data()
-        if schedule_data and schedule_data.get('payload'):
-            payload = schedule_data['payload']
-            has_schedule = self._parse_schedule_data(payload)
-            info.has_schedule = has_schedule
-            logger.debug(f"Schedule: {'Set' if has_schedule else 'None'}")
-        
-        # Get fault records from store
-        fault_data = self.get_fault_records_data()
-        if fault_data and fault_data.get('payload'):
-            payload = fault_data['payload']
-            fault_records = self._parse_fault_records(payload)
-            info.fault_records = fault_records
-            logger.debug(f"Fault records: {len(fault_records)} records")
-        
-        # Get mower status from store
-        status_data = self.get_status_data()
-        if status_data and status_data.get('payload'):
-            payload = status_data['payload']
-            status = self._parse_status(payload)
-            info.status = status
-            logger.debug(f"Status: {status.value}")
-        
+
+        # Single pass over the parser table - one store lookup per field,
+        # no getter-method indirection
+        store_get = self.response_store.get
+        for key, apply in self._FIELD_PARSERS:
+            entry = store_get(key)
+            if entry is not None:
+                apply(self, info, entry)
+
         logger.debug("Mower info collection completed")
         self.mower_info = info
         return info
 
+    async def get_mower_info(self) -> MowerInfo:
+        """Get complete mower information from the response store"""
+        return self.get_cached_info()
+
 # Example usage
 async def main():
     """Example usage of the CloudHawk library"""
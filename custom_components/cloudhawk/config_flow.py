@@ -1,7 +1,7 @@
 """Config flow for CloudHawk Lawn Mower integration."""
 import asyncio
 import logging
-from typing import Any
+from typing import Any, Final
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -11,37 +11,57 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
 from .cloudhawk_mower import CloudHawkMower
-from .const import DOMAIN
+from .const import DEFAULT_NAME, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-STEP_USER_DATA_SCHEMA = vol.Schema(
+# Normalize the MAC up front: HA's Bluetooth cache lookups are
+# case-sensitive on the colon-separated form, so a lowercase entry would
+# miss the cache and force a second validation round trip
+STEP_USER_DATA_SCHEMA: Final = vol.Schema(
     {
-        vol.Required("address"): str,
-        vol.Optional("name", default="CloudHawk Mower"): str,
+        vol.Required("address"): vol.All(
+            str, str.strip, str.upper, vol.Length(min=17, max=17)
+        ),
+        vol.Optional("name", default=DEFAULT_NAME): str,
     }
 )
 
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
+    address = data["address"]
+
+    # If HA's Bluetooth stack already sees the device advertising, that
+    # proves it exists and is reachable - no need to burn a BLE connection
+    # slot on a throwaway connect/disconnect just to produce a title
+    if bluetooth.async_address_present(hass, address, connectable=True):
+        return {"title": f"CloudHawk {address}", "serial": None}
+
+    # Fall back to a real connection attempt for addresses the scanner
+    # hasn't seen (e.g. manual entry while the mower is asleep)
     mower = CloudHawkMower()
-    
+
+    # Hand the library the scanner's cached BLEDevice (if any) so Bleak
+    # doesn't run its own discovery scan to resolve the address
+    ble_device = bluetooth.async_ble_device_from_address(hass, address, connectable=True)
+
     try:
-        if not await mower.connect(data["address"]):
+        if not await mower.connect(address, ble_device=ble_device):
             raise CannotConnect
-        
+
         # Get basic info to validate connection
         info = await mower.get_mower_info()
         serial = info.serial_number or "Unknown"
-        
-        await mower.disconnect()
-        
+
         return {"title": f"CloudHawk {serial}", "serial": serial}
-        
+
     except Exception as ex:
         _LOGGER.error(f"Connection test failed: {ex}")
         raise CannotConnect from ex
+    finally:
+        # Always release the connection slot, even when validation raises
+        await mower.disconnect()
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -51,7 +71,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self):
         """Initialize the config flow."""
-        self.discovered_devices = {}
+        # A flow only ever tracks one device, so a plain attribute beats
+        # a dict keyed by the single known address
+        self._discovered_name: str | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -73,7 +95,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self._abort_if_unique_id_configured()
                 
                 # If user didn't change the default name, use the device title instead
-                if user_input["name"] == "CloudHawk Mower":
+                if user_input["name"] == DEFAULT_NAME:
                     user_input["name"] = info["title"]
                 
                 return self.async_create_entry(title=info["title"], data=user_input)
@@ -82,22 +104,31 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    def is_matching(self, other_flow) -> bool:
+        """Return True if another flow is for the same device."""
+        return other_flow.unique_id == self.unique_id
+
     async def async_step_bluetooth(self, discovery_info) -> FlowResult:
         """Handle automatic Bluetooth discovery."""
         address = discovery_info.address
+
+        # Advertisements repeat every ~100ms; bail out before any unique-id
+        # context work if this mower is already configured
+        for entry in self._async_current_entries():
+            if entry.unique_id == address:
+                return self.async_abort(reason="already_configured")
+
         await self.async_set_unique_id(address)
         self._abort_if_unique_id_configured()
-        
+
         # Try to get device name
-        device_name = discovery_info.name or "CloudHawk Mower"
+        device_name = discovery_info.name or DEFAULT_NAME
         
         self.context["title_placeholders"] = {"name": device_name}
         
-        # Store discovery info for later
-        self.discovered_devices[address] = {
-            "address": address,
-            "name": device_name,
-        }
+        # Remember the advertised name for the confirm step; it creates
+        # the entry without connecting, so nothing else is needed
+        self._discovered_name = device_name
         
         return await self.async_step_bluetooth_confirm()
 
@@ -105,33 +136,23 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Confirm automatic Bluetooth discovery."""
-        errors: dict[str, str] = {}
-        
         if user_input is not None:
+            # The discovery advertisement already proved the device is
+            # present, so build the entry directly instead of re-validating
+            # with a BLE round trip
             address = self.unique_id
-            device_info = self.discovered_devices.get(address, {})
-            
+            name = self._discovered_name or DEFAULT_NAME
+
             data = {
                 "address": address,
-                "name": device_info.get("name", "CloudHawk Mower"),
+                "name": name,
             }
-            
-            try:
-                info = await validate_input(self.hass, data)
-                # If using default name, use the device title instead
-                if data["name"] == "CloudHawk Mower":
-                    data["name"] = info["title"]
-                return self.async_create_entry(title=info["title"], data=data)
-            except CannotConnect:
-                errors["base"] = "cannot_connect"
-            except Exception:  # pylint: disable=broad-except
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
+
+            return self.async_create_entry(title=name, data=data)
 
         return self.async_show_form(
             step_id="bluetooth_confirm",
             description_placeholders={"name": self.context["title_placeholders"]["name"]},
-            errors=errors,
         )
 
 
@@ -12,6 +12,17 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from . import CloudHawkDataUpdateCoordinator
 from .const import DOMAIN
 
+# Coordinator status label -> HA lawn mower activity. Keys match the
+# title-cased labels the coordinator emits, so lookup needs no .lower()
+_STATUS_TO_ACTIVITY = {
+    "Mowing": "mowing",
+    "Returning": "returning_to_base",
+    "Docked": "docked",
+    "Idle": "paused",
+    "Stopped": "paused",
+    "Unknown": "error",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,7 +37,12 @@ async def async_setup_entry(
 
 class CloudHawkLawnMowerEntity(CoordinatorEntity, LawnMowerEntity):
     """CloudHawk lawn mower entity."""
-    
+
+    # The HA base classes still carry __dict__, but slotting the hot
+    # per-instance attributes keeps their reads off the dict probe
+    __slots__ = ("_attrs_cache",)
+
+    _attr_has_entity_name = True
     _attr_supported_features = (
         LawnMowerEntityFeature.START_MOWING
         | LawnMowerEntityFeature.PAUSE
@@ -36,65 +52,52 @@ class CloudHawkLawnMowerEntity(CoordinatorEntity, LawnMowerEntity):
     def __init__(self, coordinator: CloudHawkDataUpdateCoordinator) -> None:
         """Initialize the lawn mower."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.device_name.lower().replace(' ', '_').replace('-', '_')}_lawn_mower"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": coordinator.device_name,
-            "manufacturer": "CloudHawk",
-            "model": "Lawn Mower",
-            "sw_version": coordinator.data.get("firmware_version") if coordinator.data else None,
-        }
-    
-    @property
-    def name(self) -> str:
-        """Return the name of the lawn mower."""
-        return self.coordinator.device_name
+        # With has_entity_name, a None name makes the main entity
+        # inherit the device name
+        self._attr_name = None
+        self._attr_unique_id = f"{coordinator.device_slug}_lawn_mower"
+        # Shared DeviceInfo built once on the coordinator, which also
+        # keeps sw_version current as updates arrive
+        self._attr_device_info = coordinator.device_info
+        # (id(data), attrs) pair so repeated attribute reads against the
+        # same coordinator snapshot reuse one dict
+        self._attrs_cache: tuple[int, dict] | None = None
     
     @property
     def activity(self) -> str | None:
         """Return the current activity of the lawn mower."""
         if not self.coordinator.data:
             return None
-        
-        status = self.coordinator.data.get("status", "").lower()
-        
-        # Map CloudHawk status to Home Assistant lawn mower activity
-        # CloudHawk states: unknown, idle, mowing, docked, returning, stopped
-        if status == "mowing":
-            return "mowing"
-        elif status == "returning":
-            return "returning_to_base"
-        elif status == "docked":
-            return "docked"
-        elif status in ["idle", "stopped"]:
-            return "paused"
-        elif status == "unknown":
-            return "error"  # Unknown state is treated as error
-        else:
-            return "paused"  # Default fallback for any unexpected status
-    
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+
+        status = self.coordinator.data.get("status")
+        # "paused" is the fallback for any unexpected status
+        return _STATUS_TO_ACTIVITY.get(status, "paused") if status else None
     
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        
+
+        # HA reads this on every state write and template evaluation;
+        # rebuild only when the coordinator publishes a new data dict
+        cached = self._attrs_cache
+        if cached is not None and cached[0] == id(data):
+            return cached[1]
+
         attributes = {
-            "battery_level": self.coordinator.data.get("battery_level"),
-            "is_charging": self.coordinator.data.get("is_charging"),
-            "signal_type": self.coordinator.data.get("signal_type"),
-            "firmware_version": self.coordinator.data.get("firmware_version"),
-            "serial_number": self.coordinator.data.get("serial_number"),
-            "trimming_enabled": self.coordinator.data.get("trimming_enabled"),
-            "has_schedule": self.coordinator.data.get("has_schedule"),
-            "fault_count": len(self.coordinator.data.get("fault_records", [])),
+            "battery_level": data.get("battery_level"),
+            "is_charging": data.get("is_charging"),
+            "signal_type": data.get("signal_type"),
+            "firmware_version": data.get("firmware_version"),
+            "serial_number": data.get("serial_number"),
+            "trimming_enabled": data.get("trimming_enabled"),
+            "has_schedule": data.get("has_schedule"),
+            "fault_count": data.get("fault_count"),
         }
-        
+
+        self._attrs_cache = (id(data), attributes)
         return attributes
     
     async def async_start_mowing(self) -> None:
@@ -54,6 +54,43 @@ SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
 )
 
 
+def _battery_attrs(data: dict) -> dict:
+    """Attributes for the battery sensor."""
+    return {"charging": data.get("is_charging", False)}
+
+
+def _signal_attrs(data: dict) -> dict:
+    """Attributes for the boundary signal sensor."""
+    return {
+        "trimming_enabled": data.get("trimming_enabled", False),
+        "ultrasonic_enabled": data.get("ultrasonic_enabled", False),
+    }
+
+
+def _fault_attrs(data: dict) -> dict | None:
+    """Attributes for the fault count sensor."""
+    # Show last 3 faults; pre-formatted by the coordinator
+    recent_faults = data.get("recent_faults")
+    if not recent_faults:
+        return None
+    return {"recent_faults": recent_faults}
+
+
+def _status_attrs(data: dict) -> dict:
+    """Attributes for the status sensor."""
+    return {"device_type": "Lawn Mower"}
+
+
+# Each sensor only ever matches one attribute builder, so bind it once
+# at construction instead of re-comparing keys per read
+_ATTR_BUILDERS = {
+    "battery_level": _battery_attrs,
+    "signal_type": _signal_attrs,
+    "fault_count": _fault_attrs,
+    "status": _status_attrs,
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -61,18 +98,23 @@ async def async_setup_entry(
 ) -> None:
     """Set up CloudHawk sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    
-    entities = [
+
+    # Feed entities straight through without building an interim list
+    async_add_entities(
         CloudHawkSensorEntity(coordinator, description)
         for description in SENSOR_DESCRIPTIONS
-    ]
-    
-    async_add_entities(entities)
+    )
 
 
 class CloudHawkSensorEntity(CoordinatorEntity, SensorEntity):
     """CloudHawk sensor entity."""
-    
+
+    # The HA base classes still carry __dict__, but slotting the hot
+    # per-instance attributes keeps their reads off the dict probe
+    __slots__ = ("_key", "_attrs_cache", "_attrs_builder")
+
+    _attr_has_entity_name = True
+
     def __init__(
         self,
         coordinator: CloudHawkDataUpdateCoordinator,
@@ -81,71 +123,45 @@ class CloudHawkSensorEntity(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
+        # Bound locally so native_value skips the entity_description hop
+        self._key = description.key
+        # With has_entity_name, HA joins the device name in once at
+        # registration instead of us formatting it per entity
+        self._attr_name = description.name
         # Use device name for unique_id to get better entity names
-        device_id = coordinator.device_name.lower().replace(" ", "_").replace("-", "_")
-        self._attr_unique_id = f"{device_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": coordinator.device_name,
-            "manufacturer": "CloudHawk",
-            "model": "Lawn Mower",
-            "sw_version": coordinator.data.get("firmware_version") if coordinator.data else None,
-        }
-    
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return f"{self.coordinator.device_name} {self.entity_description.name}"
+        self._attr_unique_id = f"{coordinator.device_slug}_{description.key}"
+        # Shared DeviceInfo built once on the coordinator, which also
+        # keeps sw_version current as updates arrive
+        self._attr_device_info = coordinator.device_info
+        # (id(data), attrs) pair so repeated attribute reads against the
+        # same coordinator snapshot reuse one dict
+        self._attrs_cache: tuple[int, dict | None] | None = None
+        self._attrs_builder = _ATTR_BUILDERS.get(description.key)
     
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        
-        key = self.entity_description.key
-        
-        if key == "fault_count":
-            fault_records = self.coordinator.data.get("fault_records", [])
-            return len(fault_records)
-        
-        return self.coordinator.data.get(key)
-    
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+        data = self.coordinator.data
+        # fault_count is precomputed by the coordinator like any other key
+        return data.get(self._key) if data else None
     
     @property
     def extra_state_attributes(self) -> dict[str, str] | None:
         """Return entity specific state attributes."""
-        if not self.coordinator.data:
+        builder = self._attrs_builder
+        if builder is None:
+            return None
+
+        data = self.coordinator.data
+        if not data:
             return None
-        
-        attributes = {}
-        
-        # Add charging status to battery sensor
-        if self.entity_description.key == "battery_level":
-            attributes["charging"] = self.coordinator.data.get("is_charging", False)
-        
-        
-        # Add trimming and ultrasonic status
-        if self.entity_description.key == "signal_type":
-            attributes["trimming_enabled"] = self.coordinator.data.get("trimming_enabled", False)
-            attributes["ultrasonic_enabled"] = self.coordinator.data.get("ultrasonic_enabled", False)
-        
-        # Add fault details to fault count sensor
-        if self.entity_description.key == "fault_count":
-            fault_records = self.coordinator.data.get("fault_records", [])
-            if fault_records:
-                # Show last 3 faults
-                recent_faults = []
-                for fault in fault_records[-3:]:
-                    recent_faults.append(f"{fault.timestamp}: Error {fault.error_code}")
-                attributes["recent_faults"] = recent_faults
-        
-        # Add additional info to status sensor
-        if self.entity_description.key == "status":
-            attributes["device_type"] = "Lawn Mower"
-        
-        return attributes if attributes else None
+
+        # HA reads this on every state write and template evaluation;
+        # rebuild only when the coordinator publishes a new data dict
+        cached = self._attrs_cache
+        if cached is not None and cached[0] == id(data):
+            return cached[1]
+
+        result = builder(data)
+        self._attrs_cache = (id(data), result)
+        return result